@@ -3,7 +3,6 @@
 from typing import Dict, Any, Optional, List
 from game_engine.core import Game
 from game_engine.templates import (
-    AVAILABLE_GAMES,
     create_prisoners_dilemma,
     create_cournot_game,
     create_auction_game,
@@ -18,13 +17,21 @@ from game_engine.strategies import (
 )
 
 
-# Strategy name to class mapping
+# Strategy name to (class, stateful) mapping. Stateful strategies keep
+# per-game memory (e.g. GrimTrigger's triggered flag) and must not be shared.
 STRATEGY_MAP = {
-    "AlwaysCooperate": AlwaysCooperate,
-    "AlwaysDefect": AlwaysDefect,
-    "TitForTat": TitForTat,
-    "GrimTrigger": GrimTrigger,
-    "RandomStrategy": RandomStrategy,
+    "AlwaysCooperate": (AlwaysCooperate, False),
+    "AlwaysDefect": (AlwaysDefect, False),
+    "TitForTat": (TitForTat, False),
+    "GrimTrigger": (GrimTrigger, True),
+    "RandomStrategy": (RandomStrategy, False),
+}
+
+# Shared instances of the stateless strategies, built once at import
+_STRATEGY_SINGLETONS = {
+    name: strategy_class()
+    for name, (strategy_class, stateful) in STRATEGY_MAP.items()
+    if not stateful
 }
 
 
@@ -32,18 +39,62 @@ def create_strategy(strategy_name: str) -> Any:
     """
     Create a strategy instance from its name.
 
+    Stateless strategies are shared singletons; stateful ones are
+    instantiated fresh on every call.
+
     Args:
         strategy_name: Name of the strategy
 
     Returns:
         Strategy instance
     """
-    strategy_class = STRATEGY_MAP.get(strategy_name)
-    if strategy_class is None:
+    try:
+        return _STRATEGY_SINGLETONS[strategy_name]
+    except KeyError:
+        pass
+    entry = STRATEGY_MAP.get(strategy_name)
+    if entry is None:
         raise ValueError(f"Unknown strategy: {strategy_name}")
+    strategy_class, _ = entry
     return strategy_class()
 
 
+def _create_prisoners_dilemma(params, player_names, strategy_instances) -> Game:
+    """Build a Prisoner's Dilemma with the given strategies and optional payoffs."""
+    return create_prisoners_dilemma(
+        player_names=player_names,
+        strategies=strategy_instances,
+        payoffs=params.get("payoffs"),
+    )
+
+
+def _create_cournot(params, player_names, strategy_instances) -> Game:
+    """Build a Cournot game from demand and cost parameters; strategies are unused."""
+    return create_cournot_game(
+        player_names=player_names,
+        demand_intercept=params.get("demand_intercept", 100.0),
+        demand_slope=params.get("demand_slope", 1.0),
+        marginal_costs=params.get("marginal_costs"),
+    )
+
+
+def _create_auction(params, player_names, strategy_instances) -> Game:
+    """Build an auction from private values and player count; strategies are unused."""
+    return create_auction_game(
+        player_names=player_names,
+        private_values=params.get("private_values"),
+        num_players=params.get("num_players", 2),
+    )
+
+
+# Game type to adapter(params, player_names, strategy_instances) mapping
+_GAME_ADAPTERS = {
+    "prisoners_dilemma": _create_prisoners_dilemma,
+    "cournot": _create_cournot,
+    "auction": _create_auction,
+}
+
+
 def create_game_from_template(
     game_type: str, params: Dict[str, Any], player_names: Optional[List[str]] = None, strategies: Optional[List[str]] = None
 ) -> Game:
@@ -59,42 +110,13 @@ def create_game_from_template(
     Returns:
         Game instance
     """
-    if game_type not in AVAILABLE_GAMES:
+    adapter = _GAME_ADAPTERS.get(game_type)
+    if adapter is None:
         raise ValueError(f"Unknown game type: {game_type}")
 
-    game_info = AVAILABLE_GAMES[game_type]
-    factory = game_info["factory"]
-
     # Convert strategies from names to instances if provided
     strategy_instances = None
     if strategies:
         strategy_instances = [create_strategy(s) for s in strategies]
 
-    # Create game based on type
-    if game_type == "prisoners_dilemma":
-        # Extract PD-specific params
-        payoffs = params.get("payoffs")
-        return create_prisoners_dilemma(
-            player_names=player_names,
-            strategies=strategy_instances,
-            payoffs=payoffs,
-        )
-
-    elif game_type == "cournot":
-        return create_cournot_game(
-            player_names=player_names,
-            demand_intercept=params.get("demand_intercept", 100.0),
-            demand_slope=params.get("demand_slope", 1.0),
-            marginal_costs=params.get("marginal_costs"),
-        )
-
-    elif game_type == "auction":
-        return create_auction_game(
-            player_names=player_names,
-            private_values=params.get("private_values"),
-            num_players=params.get("num_players", 2),
-        )
-
-    else:
-        raise ValueError(f"Unsupported game type: {game_type}")
-
+    return adapter(params, player_names, strategy_instances)
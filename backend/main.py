@@ -2,20 +2,32 @@
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List, Optional, Tuple
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from operator import itemgetter
+import asyncio
+import multiprocessing
 import sys
 import os
+import numpy as np
+import xxhash
 
 # Add parent directory to path so we can import game_engine
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from backend.models import (
+    ListGamesResponse,
     CreateGameRequest,
     CreateGameResponse,
+    GameSessionResponse,
     PlayRoundRequest,
     PlayRoundResponse,
     SimulateRequest,
     SimulateResponse,
+    ResetGameResponse,
     NashEquilibriumRequest,
     NashEquilibriumResponse,
     CournotEquilibriumRequest,
@@ -23,63 +35,333 @@ from backend.models import (
     BestResponseRequest,
     BestResponseResponse,
 )
-from backend.session_manager import session_manager
+from backend.session_manager import Session, session_manager
 from backend.game_factory import create_game_from_template
+from game_engine.core import Player
+from game_engine.strategies import Strategy
 from game_engine.normal_form import NormalFormGame
 from game_engine.cournot import CournotGame
 from game_engine.solvers import NashSolver, BestResponseAnalyzer
 from game_engine.repeated import simulate_repeated_game
 from game_engine.templates import AVAILABLE_GAMES
 
-app = FastAPI(title="Game Theory Teaching Platform API", version="1.0.0")
+# Pool for CPU-bound solver work; managed by the app lifespan
+_PROCESS_POOL: Optional[ProcessPoolExecutor] = None
+_SOLVER_WORKERS = os.cpu_count() or 1
 
-# CORS configuration
+
+def _new_process_pool() -> ProcessPoolExecutor:
+    """Create a solver process pool that does not fork the server process."""
+    # Avoid fork: the server process already runs threadpool workers
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+    return ProcessPoolExecutor(max_workers=_SOLVER_WORKERS, mp_context=context)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    """Start the solver process pool on startup and shut it down on exit."""
+    global _PROCESS_POOL
+    _PROCESS_POOL = _new_process_pool()
+    # Start every worker now rather than during the first request
+    await asyncio.gather(*(asyncio.wrap_future(_PROCESS_POOL.submit(os.getpid)) for _ in range(_SOLVER_WORKERS)))
+    try:
+        yield
+    finally:
+        _PROCESS_POOL.shutdown()
+        _PROCESS_POOL = None
+
+
+app = FastAPI(
+    title="Game Theory Teaching Platform API",
+    version="1.0.0",
+    lifespan=_lifespan,
+)
+
+# CORS configuration; explicit method/header lists let Starlette build the
+# preflight headers once, and max_age lets browsers cache preflights for a day
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    max_age=86400,
 )
 
 
-def serialize_game_state(game) -> Dict[str, Any]:
-    """Serialize game state for JSON response."""
-    state = game.get_state()
-    
-    # Add game-specific information
+class _DummyStrategy(Strategy):
+    """Placeholder strategy for games reconstructed only for analysis."""
+
+    def __init__(self):
+        super().__init__("Dummy")
+
+    def choose(self, player_id, history):
+        raise NotImplementedError()
+
+
+_DUMMY = _DummyStrategy()
+
+# Player ID strings seen in requests, mapped to their int IDs
+_PID_INT = {str(i): i for i in range(64)}
+
+# Display names for analysis players, indexed by player ID
+_PLAYER_NAMES = tuple(f"Player {i+1}" for i in range(64))
+
+# Recent Nash and best-response results, keyed by _NormalFormKey
+_SOLVER_CACHE_SIZE = 256
+_NASH_CACHE: "OrderedDict[Any, Tuple[List[List[str]], List[Dict[str, Any]]]]" = OrderedDict()
+_BEST_RESPONSE_CACHE: "OrderedDict[Any, Dict[str, Any]]" = OrderedDict()
+
+# Template listing is static, so the /games response is built once
+_GAMES_RESPONSE = {
+    "games": {
+        game_type: {
+            "name": game_info["name"],
+            "description": game_info["description"],
+            "type": game_info["type"],
+        }
+        for game_type, game_info in AVAILABLE_GAMES.items()
+    }
+}
+
+
+def _static_game_state(game) -> Dict[str, Any]:
+    """Serialize the parts of a game's state that do not change during play."""
+    static: Dict[str, Any] = {}
     if isinstance(game, NormalFormGame):
-        state["game_type"] = "normal_form"
-        state["payoff_matrix"] = game.get_payoff_matrix_dict()
-        state["actions"] = {str(k): v for k, v in game.actions.items()}
+        static["game_type"] = "normal_form"
+        static["payoff_matrix"] = game.get_payoff_matrix_dict()
+        static["actions"] = dict(game.actions)
     elif isinstance(game, CournotGame):
-        state["game_type"] = "cournot"
-        state["demand_intercept"] = game.demand_intercept
-        state["demand_slope"] = game.demand_slope
-        state["marginal_costs"] = {str(k): v for k, v in game.marginal_costs.items()}
+        static["game_type"] = "cournot"
+        static["demand_intercept"] = game.demand_intercept
+        static["demand_slope"] = game.demand_slope
+        static["marginal_costs"] = dict(game.marginal_costs)
     else:
-        state["game_type"] = "unknown"
-    
+        static["game_type"] = "unknown"
+    return static
+
+
+def serialize_game_state(game, session: Optional[Session] = None) -> Dict[str, Any]:
+    """
+    Serialize game state for JSON response.
+
+    When a session is given, the game-specific fields are built once per
+    session and the full state is reused until the session version changes.
+    Callers must hold session.lock, and must bump session.version after
+    every mutation attempt, including ones that raise.
+    """
+    if session is None:
+        return {**game.get_state(), **_static_game_state(game)}
+
+    cached = session.cached_state
+    if cached is not None and cached[0] == session.version:
+        return cached[1]
+
+    if session.static_state is None:
+        session.static_state = _static_game_state(game)
+    state = {**game.get_state(), **session.static_state}
+    session.cached_state = (session.version, state)
     return state
 
 
+def serialize_round(profile, payoffs: Dict[int, float]) -> Dict[str, Any]:
+    """Serialize one history entry for JSON response."""
+    return {
+        "profile": list(profile),
+        "payoffs": payoffs,
+    }
+
+
+def sync_serialized_history(session: Session) -> List[Dict[str, Any]]:
+    """
+    Bring a session's cached serialized history up to date with its game.
+
+    Only rounds played since the last call are serialized. If the game
+    history has shrunk (e.g. after a reset), the cache is rebuilt.
+    """
+    game = session.game
+    serialized = session.serialized_history
+    if len(game.history) < len(serialized):
+        serialized.clear()
+    for profile, payoffs in game.history[len(serialized):]:
+        serialized.append(serialize_round(profile, payoffs))
+    return serialized
+
+
+def _pid(key: str) -> int:
+    """Parse a request player ID string, using the precomputed table when possible."""
+    return _PID_INT[key] if key in _PID_INT else int(key)
+
+
+def _intkey(d: Dict[str, Any]) -> Dict[int, Any]:
+    """Convert a request dict keyed by player ID strings to int keys."""
+    return {_pid(k): v for k, v in d.items()}
+
+
+def _parse_player_actions(
+    player_actions: Dict[str, List[str]]
+) -> Tuple[List[int], Dict[int, List[str]]]:
+    """
+    Parse request player actions into sorted player IDs and an int-keyed action map.
+
+    Action names are interned so players sharing an action (e.g. "C") share
+    one string object, and every profile tuple built from these lists hashes
+    and compares by identity.
+    """
+    pairs = sorted(
+        (
+            (_pid(k), [sys.intern(a) for a in acts])
+            for k, acts in player_actions.items()
+        ),
+        key=itemgetter(0),
+    )
+    player_ids = [i for i, _ in pairs]
+    return player_ids, dict(pairs)
+
+
+def _build_payoff_tensor(
+    player_ids: List[int], actions: Dict[int, List[str]], payoff_matrix: Dict[str, List[float]]
+) -> np.ndarray:
+    """
+    Build a dense payoff tensor from a request payoff matrix.
+
+    The tensor has one axis per player (indexed by action position) plus a
+    trailing axis holding each player's payoff for that profile.
+
+    Raises:
+        ValueError: If the matrix does not cover every action profile or a
+            profile has the wrong number of payoffs
+    """
+    num_players = len(player_ids)
+    shape = tuple(len(actions[i]) for i in player_ids)
+    if len(payoff_matrix) != int(np.prod(shape)):
+        raise ValueError("Payoff matrix must define every action profile exactly once")
+
+    action_to_idx = [{a: idx for idx, a in enumerate(actions[i])} for i in player_ids]
+    payoffs = np.empty(shape + (num_players,), dtype=np.float64)
+    for key, values in payoff_matrix.items():
+        profile = key.split(",")
+        if len(profile) != num_players or len(values) != num_players:
+            raise ValueError(f"Malformed payoff entry: {key}")
+        payoffs[tuple(lookup[a] for lookup, a in zip(action_to_idx, profile))] = values
+    return payoffs
+
+
+def _build_normal_form_game(
+    player_ids: List[int], actions: Dict[int, List[str]], payoffs: np.ndarray
+) -> NormalFormGame:
+    """Create a NormalFormGame for analysis from a payoff tensor."""
+    players = [
+        Player(i, _PLAYER_NAMES[i] if 0 <= i < len(_PLAYER_NAMES) else f"Player {i+1}", _DUMMY)
+        for i in player_ids
+    ]
+    action_lists = [actions[i] for i in player_ids]
+    rows = payoffs.reshape(-1, len(player_ids)).tolist()
+    payoff_matrix = {
+        tuple(acts[k] for acts, k in zip(action_lists, idx)): dict(zip(player_ids, row))
+        for idx, row in zip(np.ndindex(payoffs.shape[:-1]), rows)
+    }
+    return NormalFormGame(players, actions, payoff_matrix)
+
+
+class _NormalFormKey:
+    """
+    Hashable cache key for a parsed normal-form game.
+
+    The hash is computed once with xxh3 over the raw payoff tensor bytes;
+    equality still compares the full contents, so collisions cannot
+    return another game's result.
+    """
+
+    __slots__ = ("player_ids", "action_lists", "shape", "data", "_hash")
+
+    def __init__(self, player_ids: List[int], actions: Dict[int, List[str]], payoffs: np.ndarray):
+        self.player_ids = tuple(player_ids)
+        self.action_lists = tuple(tuple(actions[i]) for i in player_ids)
+        self.shape = payoffs.shape
+        self.data = payoffs.tobytes()
+        self._hash = xxhash.xxh3_64_intdigest(self.data) ^ hash((self.player_ids, self.action_lists))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, _NormalFormKey):
+            return NotImplemented
+        return (
+            self._hash == other._hash
+            and self.shape == other.shape
+            and self.player_ids == other.player_ids
+            and self.action_lists == other.action_lists
+            and self.data == other.data
+        )
+
+    def thaw(self) -> Tuple[List[int], Dict[int, List[str]], np.ndarray]:
+        """Rebuild the player IDs, action map and payoff tensor."""
+        actions = {i: list(acts) for i, acts in zip(self.player_ids, self.action_lists)}
+        payoffs = np.frombuffer(self.data, dtype=np.float64).reshape(self.shape)
+        return list(self.player_ids), actions, payoffs
+
+
+def _solve_nash(key: _NormalFormKey) -> Tuple[List[List[str]], List[Dict[str, Any]]]:
+    """Compute (pure, mixed) Nash equilibria for a keyed normal-form game."""
+    game = _build_normal_form_game(*key.thaw())
+    result = NashSolver(game).find_all_nash()
+    return [list(eq) for eq in result["pure"]], result["mixed"]
+
+
+def _best_response_graph(key: _NormalFormKey) -> Dict[str, Any]:
+    """Compute best-response graph data for a keyed normal-form game."""
+    game = _build_normal_form_game(*key.thaw())
+    return BestResponseAnalyzer(game).get_deviation_graph()
+
+
+async def _run_solver_cached(
+    cache: "OrderedDict[_NormalFormKey, Any]", solver: Callable[[_NormalFormKey], Any], key: _NormalFormKey
+) -> Any:
+    """
+    Return a cached solver result, computing misses in the process pool.
+
+    Caches and the pool are only touched from the event loop, so no locking
+    is needed. Falls back to the default thread pool if the process pool is
+    not running. If a worker dies, the broken pool is replaced and the call
+    is retried once on the new pool.
+    """
+    global _PROCESS_POOL
+    if key in cache:
+        cache.move_to_end(key)
+        return cache[key]
+    loop = asyncio.get_running_loop()
+    for attempt in range(2):
+        pool = _PROCESS_POOL
+        try:
+            result = await loop.run_in_executor(pool, solver, key)
+            break
+        except BrokenProcessPool:
+            # Concurrent failures share one replacement
+            if pool is not None and _PROCESS_POOL is pool:
+                pool.shutdown(wait=False)
+                _PROCESS_POOL = _new_process_pool()
+            if attempt:
+                raise
+    cache[key] = result
+    if len(cache) > _SOLVER_CACHE_SIZE:
+        cache.popitem(last=False)
+    return result
+
+
 @app.get("/")
 def root():
     """Root endpoint."""
     return {"message": "Game Theory Teaching Platform API"}
 
 
-@app.get("/games")
+@app.get("/games", response_model=ListGamesResponse)
 def list_games():
     """List all available game templates."""
-    games = {}
-    for game_type, game_info in AVAILABLE_GAMES.items():
-        games[game_type] = {
-            "name": game_info["name"],
-            "description": game_info["description"],
-            "type": game_info["type"],
-        }
-    return {"games": games}
+    return _GAMES_RESPONSE
 
 
 @app.post("/games/create", response_model=CreateGameResponse)
@@ -108,18 +390,19 @@ def create_game(request: CreateGameRequest):
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
-@app.get("/games/{session_id}")
+@app.get("/games/{session_id}", response_model=GameSessionResponse)
 def get_game_session(session_id: str):
     """Get game session state."""
     session = session_manager.get_session(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    game = session["game"]
+    with session.lock:
+        game_state = serialize_game_state(session.game, session)
     return {
         "session_id": session_id,
-        "game_type": session["game_type"],
-        "game_state": serialize_game_state(game),
+        "game_type": session.game_type,
+        "game_state": game_state,
     }
 
 
@@ -130,26 +413,24 @@ def play_round(session_id: str, request: PlayRoundRequest):
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    game = session["game"]
+    game = session.game
     
     # Convert string keys to int keys for player IDs
-    actions = {int(k): v for k, v in request.actions.items()}
+    actions = _intkey(request.actions)
     
     try:
-        payoffs = game.play_round(actions)
-        payoffs_str = {str(k): v for k, v in payoffs.items()}
-        
-        return PlayRoundResponse(
-            payoffs=payoffs_str,
-            game_state=serialize_game_state(game),
-            history=[
-                {
-                    "profile": list(profile),
-                    "payoffs": {str(k): v for k, v in payoffs_dict.items()},
-                }
-                for profile, payoffs_dict in game.history
-            ],
-        )
+        with session.lock:
+            try:
+                payoffs = game.play_round(actions)
+            finally:
+                # Bump even on failure: the engine may have changed state before raising
+                session.version += 1
+            
+            return PlayRoundResponse(
+                payoffs=payoffs,
+                game_state=serialize_game_state(game, session),
+                history=sync_serialized_history(session),
+            )
     except (KeyError, ValueError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid action: {str(e)}")
 
@@ -161,107 +442,83 @@ def simulate_game(session_id: str, request: SimulateRequest):
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    game = session["game"]
+    game = session.game
     
     try:
-        result = simulate_repeated_game(
-            game,
-            request.num_rounds,
-            request.discount_factor,
-            reset_between_runs=False,
-        )
+        with session.lock:
+            try:
+                result = simulate_repeated_game(
+                    game,
+                    request.num_rounds,
+                    request.discount_factor,
+                    reset_between_runs=False,
+                )
+            finally:
+                # Rounds played before a failure stay in the game history
+                session.version += 1
         
         return SimulateResponse(
-            history=[
-                {
-                    "profile": list(profile),
-                    "payoffs": {str(k): v for k, v in payoffs_dict.items()},
-                }
-                for profile, payoffs_dict in result["history"]
-            ],
-            cumulative_payoffs={str(k): v for k, v in result["cumulative_payoffs"].items()},
-            discounted_payoffs={str(k): v for k, v in result["discounted_payoffs"].items()} if result["discounted_payoffs"] else None,
-            strategy_history=[{str(k): v for k, v in sh.items()} for sh in result["strategy_history"]],
+            history=[serialize_round(profile, payoffs_dict) for profile, payoffs_dict in result["history"]],
+            cumulative_payoffs=result["cumulative_payoffs"],
+            discounted_payoffs=result["discounted_payoffs"] or None,
+            strategy_history=result["strategy_history"],
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Simulation error: {str(e)}")
 
 
-@app.post("/games/{session_id}/reset")
+@app.post("/games/{session_id}/reset", response_model=ResetGameResponse)
 def reset_game(session_id: str):
     """Reset game to initial state."""
     session = session_manager.get_session(session_id)
     if session is None:
         raise HTTPException(status_code=404, detail="Session not found")
     
-    game = session["game"]
-    game.reset()
+    game = session.game
+    with session.lock:
+        try:
+            game.reset()
+        finally:
+            session.version += 1
+        session.serialized_history.clear()
+        game_state = serialize_game_state(game, session)
     
     return {
         "message": "Game reset successfully",
-        "game_state": serialize_game_state(game),
+        "game_state": game_state,
     }
 
 
 @app.post("/equilibrium/nash", response_model=NashEquilibriumResponse)
-def compute_nash_equilibrium(request: NashEquilibriumRequest):
+async def compute_nash_equilibrium(request: NashEquilibriumRequest):
     """Compute Nash equilibria for a normal-form game."""
     try:
-        # Reconstruct game from request
-        from game_engine.core import Player
-        from game_engine.strategies import Strategy
-        
-        class DummyStrategy(Strategy):
-            def __init__(self):
-                super().__init__("Dummy")
-            def choose(self, player_id, history):
-                raise NotImplementedError()
-        
-        # Parse player actions
-        player_ids = sorted([int(k) for k in request.player_actions.keys()])
-        players = [Player(i, f"Player {i+1}", DummyStrategy()) for i in player_ids]
-        
-        actions = {i: request.player_actions[str(i)] for i in player_ids}
-        
-        # Parse payoff matrix
-        payoff_matrix = {}
-        for key, payoffs in request.payoff_matrix.items():
-            profile = tuple(key.split(","))
-            payoff_matrix[profile] = {i: payoffs[idx] for idx, i in enumerate(player_ids)}
-        
-        game = NormalFormGame(players, actions, payoff_matrix)
-        
-        # Compute equilibria
-        solver = NashSolver(game)
-        result = solver.find_all_nash()
+        # Parse request; identical games reuse the cached solution
+        player_ids, actions = _parse_player_actions(request.player_actions)
+        payoffs = _build_payoff_tensor(player_ids, actions, request.payoff_matrix)
+        key = _NormalFormKey(player_ids, actions, payoffs)
+        pure, mixed = await _run_solver_cached(_NASH_CACHE, _solve_nash, key)
         
         return NashEquilibriumResponse(
-            pure_equilibria=[list(eq) for eq in result["pure"]],
-            mixed_equilibria=result["mixed"],
+            pure_equilibria=pure,
+            mixed_equilibria=mixed,
         )
-    except Exception as e:
+    except (KeyError, ValueError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid request: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Solver error: {str(e)}")
 
 
 @app.post("/equilibrium/cournot", response_model=CournotEquilibriumResponse)
 def compute_cournot_equilibrium(request: CournotEquilibriumRequest):
     """Compute Cournot equilibrium."""
     try:
-        marginal_costs = {int(k): v for k, v in request.marginal_costs.items()}
+        marginal_costs = _intkey(request.marginal_costs)
         
         # Create temporary game to compute equilibrium
-        from game_engine.core import Player
-        from game_engine.strategies import Strategy
-        
-        class DummyStrategy(Strategy):
-            def __init__(self):
-                super().__init__("Dummy")
-            def choose(self, player_id, history):
-                raise NotImplementedError()
-        
         players = [
-            Player(0, "Firm 1", DummyStrategy()),
-            Player(1, "Firm 2", DummyStrategy()),
+            Player(0, "Firm 1", _DUMMY),
+            Player(1, "Firm 2", _DUMMY),
         ]
         
         game = CournotGame(
@@ -274,54 +531,37 @@ def compute_cournot_equilibrium(request: CournotEquilibriumRequest):
         equilibrium = game.compute_equilibrium()
         
         return CournotEquilibriumResponse(
-            equilibrium_quantities={str(k): v for k, v in equilibrium["quantities"].items()},
+            equilibrium_quantities=equilibrium["quantities"],
             equilibrium_price=equilibrium["price"],
-            payoffs={str(k): v for k, v in equilibrium["payoffs"].items()},
+            payoffs=equilibrium["payoffs"],
         )
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid request: {str(e)}")
 
 
 @app.post("/analyze/best_response", response_model=BestResponseResponse)
-def analyze_best_response(request: BestResponseRequest):
+async def analyze_best_response(request: BestResponseRequest):
     """Get best response graph data."""
     try:
-        # Reconstruct game from request (similar to Nash endpoint)
-        from game_engine.core import Player
-        from game_engine.strategies import Strategy
-        
-        class DummyStrategy(Strategy):
-            def __init__(self):
-                super().__init__("Dummy")
-            def choose(self, player_id, history):
-                raise NotImplementedError()
-        
-        player_ids = sorted([int(k) for k in request.player_actions.keys()])
-        players = [Player(i, f"Player {i+1}", DummyStrategy()) for i in player_ids]
-        
-        actions = {i: request.player_actions[str(i)] for i in player_ids}
-        
-        payoff_matrix = {}
-        for key, payoffs in request.payoff_matrix.items():
-            profile = tuple(key.split(","))
-            payoff_matrix[profile] = {i: payoffs[idx] for idx, i in enumerate(player_ids)}
-        
-        game = NormalFormGame(players, actions, payoff_matrix)
-        
-        # Analyze best responses
-        analyzer = BestResponseAnalyzer(game)
-        graph_data = analyzer.get_deviation_graph()
+        # Parse request; identical games reuse the cached graph
+        player_ids, actions = _parse_player_actions(request.player_actions)
+        payoffs = _build_payoff_tensor(player_ids, actions, request.payoff_matrix)
+        key = _NormalFormKey(player_ids, actions, payoffs)
+        graph_data = await _run_solver_cached(_BEST_RESPONSE_CACHE, _best_response_graph, key)
         
         return BestResponseResponse(
             nodes=graph_data["nodes"],
             edges=graph_data["edges"],
             nash_nodes=graph_data["nash_nodes"],
         )
-    except Exception as e:
+    except (KeyError, ValueError) as e:
         raise HTTPException(status_code=400, detail=f"Invalid request: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Solver error: {str(e)}")
 
 
 if __name__ == "__main__":
     import uvicorn
+    # Sessions live in process memory, so the server must run a single worker
     uvicorn.run(app, host="0.0.0.0", port=8000)
 
@@ -4,6 +4,20 @@ from typing import Dict, List, Optional, Any
 from pydantic import BaseModel
 
 
+class GameTemplateInfo(BaseModel):
+    """Summary of an available game template."""
+
+    name: str
+    description: str
+    type: str
+
+
+class ListGamesResponse(BaseModel):
+    """Response model for listing game templates."""
+
+    games: Dict[str, GameTemplateInfo]
+
+
 class CreateGameRequest(BaseModel):
     """Request model for creating a new game session."""
 
@@ -21,6 +35,14 @@ class CreateGameResponse(BaseModel):
     game_state: Dict[str, Any]
 
 
+class GameSessionResponse(BaseModel):
+    """Response model for fetching a game session."""
+
+    session_id: str
+    game_type: str
+    game_state: Dict[str, Any]
+
+
 class PlayRoundRequest(BaseModel):
     """Request model for playing a round."""
 
@@ -30,7 +52,7 @@ class PlayRoundRequest(BaseModel):
 class PlayRoundResponse(BaseModel):
     """Response model for playing a round."""
 
-    payoffs: Dict[str, float]
+    payoffs: Dict[int, float]
     game_state: Dict[str, Any]
     history: List[Dict[str, Any]]
 
@@ -46,9 +68,16 @@ class SimulateResponse(BaseModel):
     """Response model for simulation."""
 
     history: List[Dict[str, Any]]
-    cumulative_payoffs: Dict[str, float]
-    discounted_payoffs: Optional[Dict[str, float]] = None
-    strategy_history: List[Dict[str, str]]
+    cumulative_payoffs: Dict[int, float]
+    discounted_payoffs: Optional[Dict[int, float]] = None
+    strategy_history: List[Dict[int, str]]
+
+
+class ResetGameResponse(BaseModel):
+    """Response model for resetting a game."""
+
+    message: str
+    game_state: Dict[str, Any]
 
 
 class NashEquilibriumRequest(BaseModel):
@@ -76,9 +105,9 @@ class CournotEquilibriumRequest(BaseModel):
 class CournotEquilibriumResponse(BaseModel):
     """Response model for Cournot equilibrium."""
 
-    equilibrium_quantities: Dict[str, float]
+    equilibrium_quantities: Dict[int, float]
     equilibrium_price: float
-    payoffs: Dict[str, float]
+    payoffs: Dict[int, float]
 
 
 class BestResponseRequest(BaseModel):
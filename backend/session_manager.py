@@ -1,16 +1,140 @@
 """Session manager for storing game sessions in memory."""
 
-from typing import Dict, Optional, Any, List
+from collections import OrderedDict
+from typing import Dict, Iterator, Optional, Any, List, Tuple
+import threading
+import time
 import uuid
 from game_engine.core import Game
 
 
+# Maximum number of sessions kept before evicting the least recently used
+MAX_SESSIONS = 1000
+
+# Seconds a session may sit idle before it is expired
+SESSION_TTL = 3600.0
+
+# Number of independently locked shards; must be a power of two
+NUM_SHARDS = 16
+
+
+class Session:
+    """A stored game session and its cached serialization state."""
+
+    __slots__ = (
+        "game",
+        "game_type",
+        "created_at",
+        "last_accessed",
+        "version",
+        "serialized_history",
+        "cached_state",
+        "static_state",
+        "lock",
+    )
+
+    def __init__(self, game: Game, game_type: str, created_at: float):
+        """
+        Initialize a session record.
+
+        Args:
+            game: Game instance to store
+            game_type: Type of game (for metadata)
+            created_at: Monotonic creation time
+        """
+        self.game = game
+        self.game_type = game_type
+        self.created_at = created_at
+        self.last_accessed = created_at
+        self.version = 0  # Bumped on every game mutation
+        self.serialized_history: List[Dict[str, Any]] = []
+        self.cached_state: Optional[Tuple[int, Dict[str, Any]]] = None
+        self.static_state: Optional[Dict[str, Any]] = None
+        # Held while mutating the game and reading or refreshing the caches
+        self.lock = threading.Lock()
+
+
 class SessionManager:
-    """Manages game sessions in memory."""
+    """
+    Manages game sessions in memory with LRU and idle-TTL eviction.
+
+    Sessions are spread over NUM_SHARDS shards by ID hash, each with its own
+    lock and LRU order, so concurrent requests rarely contend. A global count
+    enforces max_sessions; when it is exceeded, the session with the oldest
+    last access among the shard heads is evicted. The limit is approximate:
+    concurrent creates can overshoot it briefly before eviction catches up.
+    """
 
-    def __init__(self):
-        """Initialize session manager."""
-        self.sessions: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, max_sessions: int = MAX_SESSIONS, ttl: float = SESSION_TTL):
+        """
+        Initialize session manager.
+
+        Args:
+            max_sessions: Approximate maximum number of sessions to keep
+            ttl: Seconds of inactivity after which a session expires
+        """
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._shards: List[Tuple[threading.Lock, "OrderedDict[str, Session]"]] = [
+            (threading.Lock(), OrderedDict()) for _ in range(NUM_SHARDS)
+        ]
+        # Total sessions across shards; its lock is only ever taken innermost
+        self._count = 0
+        self._count_lock = threading.Lock()
+
+    def _shard(self, session_id: str) -> Tuple[threading.Lock, "OrderedDict[str, Session]"]:
+        """Return the (lock, sessions) shard owning a session ID."""
+        return self._shards[hash(session_id) & (NUM_SHARDS - 1)]
+
+    def _add_count(self, delta: int) -> int:
+        """Adjust the global session count and return the new total."""
+        with self._count_lock:
+            self._count += delta
+            return self._count
+
+    def _evict_expired(self, sessions: "OrderedDict[str, Session]", now: float) -> int:
+        """
+        Drop idle sessions from the least recently used end of a shard.
+
+        The caller holds the shard lock and is responsible for updating the
+        global count.
+
+        Returns:
+            Number of sessions dropped
+        """
+        dropped = 0
+        while sessions:
+            session_id, session = next(iter(sessions.items()))
+            if now - session.last_accessed < self.ttl:
+                break
+            del sessions[session_id]
+            dropped += 1
+        return dropped
+
+    def _evict_over_capacity(self) -> None:
+        """
+        Evict least recently used sessions until the global count fits.
+
+        Shard locks are taken one at a time, never nested, so this is safe to
+        call while no shard lock is held.
+        """
+        while self._add_count(0) > self.max_sessions:
+            victim = None
+            oldest = None
+            for shard in self._shards:
+                lock, sessions = shard
+                with lock:
+                    if not sessions:
+                        continue
+                    session_id, session = next(iter(sessions.items()))
+                    if oldest is None or session.last_accessed < oldest:
+                        victim, oldest = (shard, session_id), session.last_accessed
+            if victim is None:
+                return
+            (lock, sessions), session_id = victim
+            with lock:
+                if sessions.pop(session_id, None) is not None:
+                    self._add_count(-1)
 
     def create_session(
         self, session_id: Optional[str] = None, game: Game = None, game_type: str = None
@@ -29,15 +153,18 @@ class SessionManager:
         if session_id is None:
             session_id = str(uuid.uuid4())
 
-        self.sessions[session_id] = {
-            "game": game,
-            "game_type": game_type,
-            "created_at": None,  # Could add timestamp if needed
-        }
+        now = time.monotonic()
+        lock, sessions = self._shard(session_id)
+        with lock:
+            added = 0 if session_id in sessions else 1
+            sessions[session_id] = Session(game, game_type, now)
+            sessions.move_to_end(session_id)
+            self._add_count(added - self._evict_expired(sessions, now))
+        self._evict_over_capacity()
 
         return session_id
 
-    def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+    def get_session(self, session_id: str) -> Optional[Session]:
         """
         Get a session by ID.
 
@@ -45,9 +172,19 @@ class SessionManager:
             session_id: Session ID
 
         Returns:
-            Session data or None if not found
+            Session or None if not found
         """
-        return self.sessions.get(session_id)
+        now = time.monotonic()
+        lock, sessions = self._shard(session_id)
+        with lock:
+            dropped = self._evict_expired(sessions, now)
+            if dropped:
+                self._add_count(-dropped)
+            session = sessions.get(session_id)
+            if session is not None:
+                session.last_accessed = now
+                sessions.move_to_end(session_id)
+            return session
 
     def delete_session(self, session_id: str) -> bool:
         """
@@ -59,19 +196,47 @@ class SessionManager:
         Returns:
             True if deleted, False if not found
         """
-        if session_id in self.sessions:
-            del self.sessions[session_id]
-            return True
-        return False
+        lock, sessions = self._shard(session_id)
+        with lock:
+            if session_id in sessions:
+                del sessions[session_id]
+                self._add_count(-1)
+                return True
+            return False
+
+    def list_sessions(self) -> Iterator[str]:
+        """
+        Iterate over all session IDs without building one combined list.
+
+        Each shard is snapshotted under its own lock and its IDs are yielded
+        after the lock is released, so the result is not a single atomic
+        snapshot. Use snapshot_session_ids for that.
+
+        Returns:
+            Iterator of session IDs
+        """
+        for lock, sessions in self._shards:
+            with lock:
+                shard_ids = tuple(sessions)
+            yield from shard_ids
 
-    def list_sessions(self) -> List[str]:
+    def snapshot_session_ids(self) -> Tuple[str, ...]:
         """
-        List all session IDs.
+        Take a consistent snapshot of all session IDs.
+
+        All shard locks are held together while the IDs are collected.
 
         Returns:
-            List of session IDs
+            Tuple of session IDs
         """
-        return list(self.sessions.keys())
+        locks = [lock for lock, _ in self._shards]
+        for lock in locks:
+            lock.acquire()
+        try:
+            return tuple(session_id for _, sessions in self._shards for session_id in sessions)
+        finally:
+            for lock in reversed(locks):
+                lock.release()
 
 
 # Global session manager instance
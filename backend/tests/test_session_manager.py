@@ -0,0 +1,85 @@
+"""Tests for the sharded in-memory session manager."""
+
+import random
+import threading
+
+import backend.session_manager as session_manager_module
+from backend.session_manager import SessionManager
+
+
+class FakeClock:
+    """Stand-in for the time module whose monotonic clock only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+def test_cap_holds_after_more_creates_than_max_sessions():
+    manager = SessionManager(max_sessions=10)
+    session_ids = [manager.create_session() for _ in range(50)]
+
+    assert manager._count == 10
+    assert len(manager.snapshot_session_ids()) == 10
+    # Sessions are evicted least recently used first
+    assert manager.get_session(session_ids[-1]) is not None
+    assert manager.get_session(session_ids[0]) is None
+
+
+def test_count_matches_stored_sessions_after_concurrent_access():
+    manager = SessionManager(max_sessions=200)
+    errors = []
+
+    def worker(seed: int) -> None:
+        rng = random.Random(seed)
+        owned = []
+        try:
+            for _ in range(500):
+                op = rng.random()
+                if op < 0.5 or not owned:
+                    owned.append(manager.create_session())
+                elif op < 0.8:
+                    manager.get_session(rng.choice(owned))
+                else:
+                    manager.delete_session(owned.pop(rng.randrange(len(owned))))
+        except Exception as exc:  # pragma: no cover - surfaced by the assert below
+            errors.append(exc)
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    assert manager._count == len(manager.snapshot_session_ids())
+    assert manager._count <= manager.max_sessions
+
+
+def test_expired_session_is_dropped_on_access(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(session_manager_module, "time", clock)
+    manager = SessionManager(ttl=60.0)
+    session_id = manager.create_session()
+
+    clock.now += 30.0
+    assert manager.get_session(session_id) is not None
+
+    clock.now += 61.0
+    assert manager.get_session(session_id) is None
+    assert manager._count == 0
+    assert manager.snapshot_session_ids() == ()
+
+
+def test_list_sessions_matches_snapshot():
+    manager = SessionManager()
+    created = {manager.create_session() for _ in range(100)}
+    manager.delete_session(next(iter(created)))
+
+    listed = list(manager.list_sessions())
+    snapshot = manager.snapshot_session_ids()
+
+    assert len(listed) == len(snapshot) == 99
+    assert set(listed) == set(snapshot)